@@ -3,21 +3,78 @@ Flask API server for Precious Metals Bull Market Tracker
 Uses in-memory SQLite database loaded from SQL dump for deployment
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
 import sqlite3
 import os
+import re
 import sys
+import threading
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
+# Responses are encoded with orjson rather than SQLite's json_object /
+# json_group_array: JSON1 prints REAL values with only 15 significant
+# digits, which would alter most price and percentage values
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which encodes straight to UTF-8 bytes"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json'
+        )
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
-# Global in-memory database connection
+# The database is loaded once from a static dump and never written to, so
+# encoded responses stay valid until init_database runs again
+RESPONSE_CACHE_SIZE = 512
+
+# Compiled statements kept per connection; every query uses static SQL text
+# with bound parameters so repeat requests reuse the prepared bytecode
+STATEMENT_CACHE_SIZE = 512
+
+# raw-data pages larger than this are streamed instead of cached
+RAW_DATA_STREAM_THRESHOLD = 1000
+
+# Rows read from SQLite and encoded together per streamed chunk
+RAW_DATA_STREAM_BATCH_SIZE = 1000
+
+# Shared-cache in-memory database: every connection in the process opened
+# with this URI sees the same tables, which live as long as db_conn is open
+DATABASE_URI = 'file::memory:?cache=shared'
+
+# Binary copy of the loaded dump (before indexes and derived tables are
+# built), written next to the dump and reused while it is the newer file
+SNAPSHOT_NAME = 'snapshot.bin'
+
+# Global in-memory database connection, used to load the dump
 db_conn = None
 db_init_error = None
 
+# Serializes the first-request database load across threads
+init_lock = threading.Lock()
+
+# Per-thread read-only connections used to serve requests
+thread_local = threading.local()
+
 def find_sql_dump():
     """Find the SQL dump file using multiple strategies"""
     # Strategy 1: Same directory as this file (src/)
@@ -44,23 +101,157 @@ def find_sql_dump():
     
     return None
 
+# Dashboard roll-up: one row per metal with every market-summary field
+# precomputed, since the dump is loaded once and never written to
+MARKET_SUMMARY_MV_SQL = '''
+    CREATE TABLE market_summary_mv AS
+    WITH latest AS (
+        SELECT metal, close_price, date, days_from_start, weeks_from_start,
+               ROW_NUMBER() OVER (PARTITION BY metal ORDER BY date DESC) AS rn,
+               SUM(is_limit_up = 1) OVER (PARTITION BY metal) AS limit_up_count
+        FROM current_prices
+    ),
+    peaks AS (
+        SELECT hp.metal, MAX(hp.close_price) AS peak_price, mc.start_price AS peak_start
+        FROM historical_prices hp
+        LEFT JOIN market_cycles mc
+            ON mc.metal = hp.metal AND mc.cycle_name = hp.cycle_name
+        WHERE hp.cycle_name = LOWER(hp.metal) || '_1978_1980'
+        GROUP BY hp.metal, mc.start_price
+    )
+    SELECT
+        latest.metal,
+        latest.close_price AS current_price,
+        ROUND((latest.close_price - cur.start_price) / cur.start_price * 100, 1) AS current_return,
+        latest.days_from_start,
+        latest.weeks_from_start,
+        latest.date AS last_update,
+        peaks.peak_price AS historical_peak,
+        COALESCE(ROUND((peaks.peak_price - peaks.peak_start) / peaks.peak_start * 100, 1), 0)
+            AS historical_peak_return,
+        latest.limit_up_count AS limit_up_days
+    FROM latest
+    JOIN market_cycles cur
+        ON cur.metal = latest.metal AND cur.cycle_name = LOWER(latest.metal) || '_2024_current'
+    LEFT JOIN peaks ON peaks.metal = latest.metal
+    WHERE latest.rn = 1 AND latest.metal IN ('GOLD', 'SILVER')
+    ORDER BY latest.metal
+'''
+
+# Weekly aggregates with the chart's volatility classification resolved up
+# front: |week-over-week %| >= 5 is high volatility, >= 2 is volatile.
+# Missing or zero week-over-week changes are reported as 0
+WEEKLY_AGGREGATES_MV_SQL = '''
+    CREATE TABLE weekly_aggregates_mv AS
+    SELECT
+        *,
+        CASE WHEN week_over_week_pct THEN week_over_week_pct ELSE 0 END
+            AS week_over_week_change,
+        CASE
+            WHEN ABS(COALESCE(week_over_week_pct, 0)) >= 5 THEN '#ef4444'
+            WHEN ABS(COALESCE(week_over_week_pct, 0)) >= 2 THEN '#eab308'
+            ELSE '#22c55e'
+        END AS dot_color,
+        CASE
+            WHEN ABS(COALESCE(week_over_week_pct, 0)) >= 5 THEN 'high_volatility'
+            WHEN ABS(COALESCE(week_over_week_pct, 0)) >= 2 THEN 'volatile'
+            ELSE 'normal'
+        END AS volatility_level
+    FROM weekly_aggregates
+    ORDER BY metal, cycle_name, weeks_from_start
+'''
+
+# Indexes the dump does not ship with. It already indexes current_prices
+# on (metal, date) and weekly_aggregates on (metal, cycle_name,
+# weeks_from_start); historical_prices only has (metal, date), which leaves
+# the cycle filter to a row-by-row check
+EXTRA_INDEXES_SQL = [
+    '''
+    CREATE INDEX IF NOT EXISTS idx_historical_metal_cycle_date
+    ON historical_prices(metal, cycle_name, date DESC)
+    ''',
+]
+
+def create_indexes(conn):
+    """Add the indexes hot queries rely on to the freshly loaded dump"""
+    for sql in EXTRA_INDEXES_SQL:
+        conn.execute(sql)
+    conn.commit()
+
+def build_materialized_views(conn):
+    """Precompute derived tables from the freshly loaded dump"""
+    conn.execute('DROP TABLE IF EXISTS market_summary_mv')
+    conn.execute(MARKET_SUMMARY_MV_SQL)
+    conn.execute('DROP TABLE IF EXISTS weekly_aggregates_mv')
+    conn.execute(WEEKLY_AGGREGATES_MV_SQL)
+    conn.execute('''
+        CREATE INDEX idx_weekly_mv_cycle
+        ON weekly_aggregates_mv(metal, cycle_name, weeks_from_start)
+    ''')
+    conn.commit()
+
+def load_snapshot(conn, snapshot_path, sql_dump_path):
+    """Restore the dump from a binary snapshot if one newer than the dump exists"""
+    try:
+        if snapshot_path.stat().st_mtime <= sql_dump_path.stat().st_mtime:
+            return False
+        # Deserializing straight into a shared-cache connection is not seen
+        # by the other connections, so go through a private one and copy
+        snapshot = sqlite3.connect(':memory:')
+        try:
+            snapshot.deserialize(snapshot_path.read_bytes())
+            snapshot.backup(conn)
+        finally:
+            snapshot.close()
+    except (OSError, sqlite3.DatabaseError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"⚠️ Ignoring database snapshot {snapshot_path}: {e}")
+        return False
+    print(f"✅ Restored database snapshot from: {snapshot_path}")
+    return True
+
+def save_snapshot(conn, snapshot_path):
+    """Write the freshly loaded dump to a binary snapshot for faster restarts"""
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(conn.serialize())
+        os.replace(tmp_path, snapshot_path)
+    except OSError as e:
+        print(f"⚠️ Could not write database snapshot {snapshot_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
 def init_database():
     """Initialize in-memory database from SQL dump"""
     global db_conn, db_init_error
     
+    print("🚀 Initializing Precious Metals API...")
+    print(f"📂 Current working directory: {Path.cwd()}")
+    print(f"📂 Script location: {Path(__file__).resolve().parent}")
+    
+    # Create in-memory database; it only becomes db_conn once fully loaded
+    conn = sqlite3.connect(
+        DATABASE_URI, uri=True, check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE
+    )
+    conn.row_factory = sqlite3.Row
+    
     try:
-        # Create in-memory database
-        db_conn = sqlite3.connect('file::memory:?cache=shared', uri=True, check_same_thread=False)
-        db_conn.row_factory = sqlite3.Row
-        
         # Find SQL dump
         sql_dump_path = find_sql_dump()
         
         if sql_dump_path and sql_dump_path.exists():
             print(f"✅ Found SQL dump at: {sql_dump_path}")
-            with open(sql_dump_path, 'r') as f:
-                sql_script = f.read()
-                db_conn.executescript(sql_script)
+            snapshot_path = sql_dump_path.with_name(SNAPSHOT_NAME)
+            if not load_snapshot(conn, snapshot_path, sql_dump_path):
+                with open(sql_dump_path, 'r') as f:
+                    sql_script = f.read()
+                    conn.executescript(sql_script)
+                save_snapshot(conn, snapshot_path)
+            create_indexes(conn)
+            build_materialized_views(conn)
+            verify_query_plans(conn)
+            verify_column_types(conn)
+            clear_response_caches()
             print(f"✅ Database loaded successfully")
             db_init_error = None
         else:
@@ -69,31 +260,161 @@ def init_database():
             db_init_error = error_msg
             raise FileNotFoundError(error_msg)
         
+        db_conn = conn
         return db_conn
     except Exception as e:
+        # Closing the last connection discards the partly loaded database,
+        # so the next request starts over from an empty one
+        conn.close()
         db_init_error = str(e)
         print(f"❌ Database initialization failed: {e}")
         raise
 
 def get_db_connection():
-    """Get database connection"""
-    global db_conn
+    """Get this thread's read-only connection to the in-memory database"""
+    # The database is loaded by whichever request needs it first, so
+    # workers start accepting connections without waiting on the dump
     if db_conn is None:
-        db_conn = init_database()
-    return db_conn
+        with init_lock:
+            if db_conn is None:
+                init_database()
+    
+    conn = getattr(thread_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE_URI, uri=True, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA query_only = 1')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        # Nothing writes after the load, so readers can skip shared-cache
+        # table locks instead of queueing behind each other
+        conn.execute('PRAGMA read_uncommitted = 1')
+        thread_local.conn = conn
+    return conn
+
+WEEKLY_DATA_SQL = '''
+    SELECT 
+        weeks_from_start,
+        week_start_date,
+        close_price,
+        cycle_change_pct,
+        week_over_week_change,
+        limit_up_days,
+        limit_down_days,
+        total_trading_days,
+        dot_color,
+        volatility_level
+    FROM weekly_aggregates_mv 
+    WHERE metal = ? AND cycle_name = ?
+    ORDER BY weeks_from_start
+'''
+
+# raw-data reads current_prices for the live cycle (one per metal) and
+# historical_prices, filtered by cycle name, for everything else. Page
+# queries carry the filtered row count on every row; the count queries are
+# only needed when the page itself is empty
+RAW_DATA_COLUMNS = (
+    'date', 'open_price', 'high_price', 'low_price', 'close_price',
+    'daily_change_pct', 'is_limit_up', 'is_limit_down',
+    'days_from_start', 'weeks_from_start', 'volume'
+)
+
+CURRENT_COUNT_SQL = '''
+    SELECT COUNT(*) as total FROM current_prices WHERE metal = ?
+'''
+
+CURRENT_PAGE_SQL = '''
+    SELECT date, open_price, high_price, low_price, close_price, 
+           daily_change_pct, is_limit_up, is_limit_down, 
+           days_from_start, weeks_from_start, volume,
+           COUNT(*) OVER () as total_records
+    FROM current_prices 
+    WHERE metal = ?
+    ORDER BY date DESC
+    LIMIT ? OFFSET ?
+'''
+
+HISTORICAL_COUNT_SQL = '''
+    SELECT COUNT(*) as total FROM historical_prices
+    WHERE metal = ? AND cycle_name = ?
+'''
+
+HISTORICAL_PAGE_SQL = '''
+    SELECT date, open_price, high_price, low_price, close_price, 
+           daily_change_pct, is_limit_up, is_limit_down, 
+           days_from_start, weeks_from_start, volume,
+           COUNT(*) OVER () as total_records
+    FROM historical_prices 
+    WHERE metal = ? AND cycle_name = ?
+    ORDER BY date DESC
+    LIMIT ? OFFSET ?
+'''
+
+# Hot request-path queries that must resolve to index searches; a full
+# table scan here means an index went missing
+INDEXED_QUERIES = {
+    'weekly-data': WEEKLY_DATA_SQL,
+    'raw-data current count': CURRENT_COUNT_SQL,
+    'raw-data current page': CURRENT_PAGE_SQL,
+    'raw-data historical count': HISTORICAL_COUNT_SQL,
+    'raw-data historical page': HISTORICAL_PAGE_SQL,
+}
+
+def verify_query_plans(conn):
+    """Warn about hot queries whose plan scans a whole table"""
+    for name, sql in INDEXED_QUERIES.items():
+        params = (None,) * sql.count('?')
+        plan = conn.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()
+        # "SCAN (subquery-N)" walks an already filtered window result
+        scans = [row[3] for row in plan if re.match(r'SCAN \w', row[3])]
+        if scans:
+            print(f"⚠️ {name} query is not using an index: {'; '.join(scans)}")
+
+# Numeric columns served by the API. They are stored as REAL/INTEGER, so
+# sqlite3 hands back Python floats and ints that orjson encodes natively;
+# a TEXT value here would reach clients as a JSON string
+NUMERIC_COLUMNS = {
+    'weekly_aggregates_mv': (
+        'close_price', 'cycle_change_pct', 'week_over_week_change',
+        'limit_up_days', 'limit_down_days', 'total_trading_days'
+    ),
+    'current_prices': RAW_DATA_COLUMNS[1:],
+    'historical_prices': RAW_DATA_COLUMNS[1:],
+}
 
-def serialize_data(data):
-    """Convert database rows to JSON-serializable format"""
-    if isinstance(data, list):
-        return [dict(row) for row in data]
-    elif hasattr(data, 'keys'):
-        return dict(data)
-    return data
+def verify_column_types(conn):
+    """Warn about numeric columns holding values stored as text"""
+    for table, columns in NUMERIC_COLUMNS.items():
+        checks = ', '.join(f"SUM(typeof({column}) = 'text')" for column in columns)
+        counts = conn.execute(f'SELECT {checks} FROM {table}').fetchone()
+        text_columns = [column for column, count in zip(columns, counts) if count]
+        if text_columns:
+            print(f"⚠️ {table} has text values in numeric columns: {', '.join(text_columns)}")
+
+def json_response(payload, status=200):
+    """Build a JSON response from orjson bytes, skipping str -> bytes re-encoding"""
+    if not isinstance(payload, bytes):
+        payload = orjson.dumps(payload, option=ORJSON_OPTIONS)
+    return app.response_class(
+        payload,
+        status=status,
+        mimetype='application/json'
+    )
+
+def timestamped_response(key, body):
+    """Wrap a pre-encoded JSON body as {key: body, 'timestamp': now}"""
+    return json_response(
+        b'{"' + key.encode('utf-8') + b'":' + body
+        + b',"timestamp":' + orjson.dumps(datetime.now().isoformat()) + b'}'
+    )
+
+def page_row(row):
+    """Convert a raw-data page tuple to a dict, leaving out its trailing total"""
+    return dict(zip(RAW_DATA_COLUMNS, row))
 
 @app.route('/')
 def home():
     """API home endpoint - simple status check"""
-    return jsonify({
+    return json_response({
         'name': 'Precious Metals Bull Market Tracker API',
         'version': '1.0',
         'status': 'ok'
@@ -108,7 +429,7 @@ def health_check():
         cursor.execute('SELECT COUNT(*) as count FROM current_prices')
         result = cursor.fetchone()
         
-        return jsonify({
+        return json_response({
             'status': 'healthy',
             'database': 'connected',
             'database_type': 'in-memory',
@@ -116,76 +437,116 @@ def health_check():
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e),
             'init_error': db_init_error,
             'timestamp': datetime.now().isoformat()
-        }), 500
+        }, 500)
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def cached_weekly_data(metal, cycle):
+    """Encoded weekly-data body for an upper-cased metal and a cycle"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    # Plain tuples unpack faster than sqlite3.Row lookups by column name
+    cursor.row_factory = None
+    
+    cursor.execute(WEEKLY_DATA_SQL, (metal, cycle))
+    
+    data = [
+        {
+            'week': week,
+            'date': date,
+            'price': price,
+            'percentChange': pct,
+            'weekOverWeekChange': wow_pct,
+            'limitUpDays': up_days,
+            'limitDownDays': down_days,
+            'tradingDays': trading_days,
+            'dotColor': dot_color,
+            'volatilityLevel': volatility_level,
+            'showDot': True
+        }
+        for (week, date, price, pct, wow_pct, up_days, down_days,
+             trading_days, dot_color, volatility_level) in cursor.fetchall()
+    ]
+    
+    return orjson.dumps({
+        'metal': metal,
+        'cycle': cycle,
+        'data': data,
+        'total_weeks': len(data)
+    }, option=ORJSON_OPTIONS)
 
 @app.route('/api/weekly-data/<metal>/<cycle>', methods=['GET'])
 def get_weekly_data(metal, cycle):
     """Get weekly aggregated data for a specific metal and cycle"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                weeks_from_start,
-                week_start_date,
-                close_price,
-                cycle_change_pct,
-                limit_up_days,
-                limit_down_days,
-                volatility_indicator,
-                total_trading_days,
-                week_over_week_pct
-            FROM weekly_aggregates 
-            WHERE metal = ? AND cycle_name = ?
-            ORDER BY weeks_from_start
-        ''', (metal.upper(), cycle))
-        
-        rows = cursor.fetchall()
-        
-        data = []
-        for row in rows:
-            wow_pct = row['week_over_week_pct'] if row['week_over_week_pct'] else 0
-            abs_wow = abs(wow_pct)
-            
-            if abs_wow >= 5:
-                dot_color = '#ef4444'
-                volatility_level = 'high_volatility'
-            elif abs_wow >= 2:
-                dot_color = '#eab308'
-                volatility_level = 'volatile'
-            else:
-                dot_color = '#22c55e'
-                volatility_level = 'normal'
-            
-            data.append({
-                'week': row['weeks_from_start'],
-                'date': row['week_start_date'],
-                'price': row['close_price'],
-                'percentChange': row['cycle_change_pct'],
-                'weekOverWeekChange': wow_pct,
-                'limitUpDays': row['limit_up_days'],
-                'limitDownDays': row['limit_down_days'],
-                'tradingDays': row['total_trading_days'],
-                'dotColor': dot_color,
-                'volatilityLevel': volatility_level,
-                'showDot': True
-            })
-        
-        return jsonify({
-            'metal': metal.upper(),
-            'cycle': cycle,
-            'data': data,
-            'total_weeks': len(data)
-        })
+        return json_response(cached_weekly_data(metal.upper(), cycle))
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
+
+def query_raw_data(metal, cycle, limit, offset):
+    """Count a metal/cycle's daily rows and iterate over one page of them"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    # Plain tuples zip straight into dicts without sqlite3.Row lookups
+    cursor.row_factory = None
+    
+    if cycle.endswith('_current'):
+        count_sql, page_sql, params = CURRENT_COUNT_SQL, CURRENT_PAGE_SQL, (metal,)
+    else:
+        count_sql, page_sql, params = HISTORICAL_COUNT_SQL, HISTORICAL_PAGE_SQL, (metal, cycle)
+    
+    cursor.execute(page_sql, params + (limit, offset))
+    first_row = cursor.fetchone()
+    if first_row is None:
+        cursor.execute(count_sql, params)
+        return cursor.fetchone()[0], []
+    
+    return first_row[-1], chain([first_row], cursor)
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def cached_raw_data(metal, cycle, limit, offset):
+    """Encoded raw-data body for an upper-cased metal, a cycle and a page"""
+    total_records, rows = query_raw_data(metal, cycle, limit, offset)
+    data = [page_row(row) for row in rows]
+    
+    return orjson.dumps({
+        'metal': metal,
+        'cycle': cycle,
+        'data': data,
+        'total_records': total_records,
+        'limit': limit,
+        'offset': offset,
+        'has_more': (offset + limit) < total_records
+    }, option=ORJSON_OPTIONS)
+
+def stream_raw_data(metal, cycle, limit, offset, total_records, rows):
+    """Yield a raw-data body in encoded batches of rows"""
+    yield (
+        b'{"metal":' + orjson.dumps(metal)
+        + b',"cycle":' + orjson.dumps(cycle)
+        + b',"data":['
+    )
+    separator = b''
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, RAW_DATA_STREAM_BATCH_SIZE))
+        if not batch:
+            break
+        # One orjson call per batch; drop its [ ] to splice into the array
+        encoded = orjson.dumps([page_row(row) for row in batch], option=ORJSON_OPTIONS)
+        yield separator + encoded[1:-1]
+        separator = b','
+    yield b'],' + orjson.dumps({
+        'total_records': total_records,
+        'limit': limit,
+        'offset': offset,
+        'has_more': (offset + limit) < total_records
+    })[1:]
 
 @app.route('/api/raw-data/<metal>/<cycle>', methods=['GET'])
 def get_raw_data(metal, cycle):
@@ -193,173 +554,106 @@ def get_raw_data(metal, cycle):
     try:
         limit = request.args.get('limit', 100, type=int)
         offset = request.args.get('offset', 0, type=int)
+        metal = metal.upper()
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        if cycle.endswith('_current'):
-            table = 'current_prices'
-            cycle_filter = f"metal = '{metal.upper()}'"
-        else:
-            table = 'historical_prices'
-            cycle_filter = f"metal = '{metal.upper()}' AND cycle_name = '{cycle}'"
-        
-        cursor.execute(f'SELECT COUNT(*) as total FROM {table} WHERE {cycle_filter}')
-        total_records = cursor.fetchone()['total']
-        
-        cursor.execute(f'''
-            SELECT date, open_price, high_price, low_price, close_price, 
-                   daily_change_pct, is_limit_up, is_limit_down, 
-                   days_from_start, weeks_from_start, volume
-            FROM {table} 
-            WHERE {cycle_filter}
-            ORDER BY date DESC
-            LIMIT ? OFFSET ?
-        ''', (limit, offset))
+        if 0 <= limit <= RAW_DATA_STREAM_THRESHOLD:
+            return json_response(cached_raw_data(metal, cycle, limit, offset))
         
-        rows = cursor.fetchall()
-        data = serialize_data(rows)
-        
-        return jsonify({
-            'metal': metal.upper(),
-            'cycle': cycle,
-            'data': data,
-            'total_records': total_records,
-            'limit': limit,
-            'offset': offset,
-            'has_more': (offset + limit) < total_records
-        })
+        # Large (or unbounded, for negative limits) pages are streamed rather
+        # than built in memory and kept in the response cache
+        total_records, rows = query_raw_data(metal, cycle, limit, offset)
+        return app.response_class(
+            stream_raw_data(metal, cycle, limit, offset, total_records, rows),
+            mimetype='application/json'
+        )
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
+
+@lru_cache(maxsize=1)
+def cached_market_summary():
+    """Encoded market-summary object, without the response timestamp"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute('SELECT * FROM market_summary_mv')
+    
+    summary = {}
+    for row in cursor.fetchall():
+        summary[row['metal'].lower()] = {
+            'currentPrice': row['current_price'],
+            'currentReturn': row['current_return'],
+            'daysInCycle': row['days_from_start'],
+            'weeksInCycle': row['weeks_from_start'],
+            'lastUpdate': row['last_update'],
+            'historicalPeak': row['historical_peak'],
+            'historicalPeakReturn': row['historical_peak_return'],
+            'limitUpDays': row['limit_up_days']
+        }
+    
+    return orjson.dumps(summary, option=ORJSON_OPTIONS)
 
 @app.route('/api/market-summary', methods=['GET'])
 def get_market_summary():
     """Get current market summary for dashboard"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        summary = {}
-        
-        for metal in ['GOLD', 'SILVER']:
-            cursor.execute('''
-                SELECT close_price, date, days_from_start, weeks_from_start
-                FROM current_prices 
-                WHERE metal = ?
-                ORDER BY date DESC 
-                LIMIT 1
-            ''', (metal,))
-            
-            current_data = cursor.fetchone()
-            
-            cursor.execute('''
-                SELECT start_price FROM market_cycles 
-                WHERE metal = ? AND cycle_name = ?
-            ''', (metal, f"{metal.lower()}_2024_current"))
-            
-            cycle_info = cursor.fetchone()
-            
-            cursor.execute('''
-                SELECT MAX(close_price) as peak_price
-                FROM historical_prices
-                WHERE metal = ? AND cycle_name = ?
-            ''', (metal, f"{metal.lower()}_1978_1980"))
-            
-            historical_peak = cursor.fetchone()
-            
-            cursor.execute('''
-                SELECT COUNT(*) as limit_up_count
-                FROM current_prices
-                WHERE metal = ? AND is_limit_up = 1
-            ''', (metal,))
-            
-            limit_up_info = cursor.fetchone()
-            
-            if current_data and cycle_info:
-                current_price = current_data['close_price']
-                start_price = cycle_info['start_price']
-                current_return = ((current_price - start_price) / start_price) * 100
-                
-                hist_peak_return = 0
-                if historical_peak and historical_peak['peak_price']:
-                    hist_start_cursor = conn.cursor()
-                    hist_start_cursor.execute('''
-                        SELECT start_price FROM market_cycles 
-                        WHERE metal = ? AND cycle_name = ?
-                    ''', (metal, f"{metal.lower()}_1978_1980"))
-                    hist_start = hist_start_cursor.fetchone()
-                    if hist_start:
-                        hist_peak_return = ((historical_peak['peak_price'] - hist_start['start_price']) / hist_start['start_price']) * 100
-                
-                summary[metal.lower()] = {
-                    'currentPrice': current_price,
-                    'currentReturn': round(current_return, 1),
-                    'daysInCycle': current_data['days_from_start'],
-                    'weeksInCycle': current_data['weeks_from_start'],
-                    'lastUpdate': current_data['date'],
-                    'historicalPeak': historical_peak['peak_price'] if historical_peak else 0,
-                    'historicalPeakReturn': round(hist_peak_return, 1),
-                    'limitUpDays': limit_up_info['limit_up_count'] if limit_up_info else 0
-                }
-        
-        return jsonify({
-            'summary': summary,
-            'timestamp': datetime.now().isoformat()
-        })
+        return timestamped_response('summary', cached_market_summary())
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
+
+@lru_cache(maxsize=1)
+def cached_database_stats():
+    """Encoded database-stats object, without the response timestamp"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute('''
+        SELECT COUNT(*) FILTER (WHERE metal = 'GOLD') as gold,
+               COUNT(*) FILTER (WHERE metal = 'SILVER') as silver,
+               MIN(date) as start, MAX(date) as end
+        FROM historical_prices
+    ''')
+    historical = cursor.fetchone()
+    
+    cursor.execute('''
+        SELECT COUNT(*) FILTER (WHERE metal = 'GOLD') as gold,
+               COUNT(*) FILTER (WHERE metal = 'SILVER') as silver,
+               MIN(date) as start, MAX(date) as end
+        FROM current_prices
+    ''')
+    current = cursor.fetchone()
+    
+    cursor.execute('SELECT COUNT(*) as count FROM weekly_aggregates')
+    weekly_count = cursor.fetchone()['count']
+    
+    stats = {
+        'gold_historical': historical['gold'],
+        'silver_historical': historical['silver'],
+        'gold_current': current['gold'],
+        'silver_current': current['silver'],
+        'weekly_aggregates': weekly_count,
+        'historical_range': {'start': historical['start'], 'end': historical['end']},
+        'current_range': {'start': current['start'], 'end': current['end']}
+    }
+    
+    return orjson.dumps(stats, option=ORJSON_OPTIONS)
 
 @app.route('/api/database-stats', methods=['GET'])
 def get_database_stats():
     """Get database statistics"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        stats = {}
-        
-        cursor.execute('SELECT COUNT(*) as count FROM historical_prices WHERE metal = "GOLD"')
-        stats['gold_historical'] = cursor.fetchone()['count']
-        
-        cursor.execute('SELECT COUNT(*) as count FROM historical_prices WHERE metal = "SILVER"')
-        stats['silver_historical'] = cursor.fetchone()['count']
-        
-        cursor.execute('SELECT COUNT(*) as count FROM current_prices WHERE metal = "GOLD"')
-        stats['gold_current'] = cursor.fetchone()['count']
-        
-        cursor.execute('SELECT COUNT(*) as count FROM current_prices WHERE metal = "SILVER"')
-        stats['silver_current'] = cursor.fetchone()['count']
-        
-        cursor.execute('SELECT COUNT(*) as count FROM weekly_aggregates')
-        stats['weekly_aggregates'] = cursor.fetchone()['count']
-        
-        cursor.execute('SELECT MIN(date) as start, MAX(date) as end FROM historical_prices')
-        hist_range = cursor.fetchone()
-        stats['historical_range'] = {'start': hist_range['start'], 'end': hist_range['end']}
-        
-        cursor.execute('SELECT MIN(date) as start, MAX(date) as end FROM current_prices')
-        current_range = cursor.fetchone()
-        stats['current_range'] = {'start': current_range['start'], 'end': current_range['end']}
-        
-        return jsonify({
-            'stats': stats,
-            'timestamp': datetime.now().isoformat()
-        })
+        return timestamped_response('stats', cached_database_stats())
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-# Initialize database on module load
-print("🚀 Initializing Precious Metals API...")
-print(f"📂 Current working directory: {Path.cwd()}")
-print(f"📂 Script location: {Path(__file__).resolve().parent}")
-try:
-    init_database()
-    print("✅ Database initialization complete")
-except Exception as e:
-    print(f"❌ Database initialization failed: {e}")
+        return json_response({'error': str(e)}, 500)
+
+def clear_response_caches():
+    """Drop every cached response body, e.g. after the database is reloaded"""
+    cached_weekly_data.cache_clear()
+    cached_raw_data.cache_clear()
+    cached_market_summary.cache_clear()
+    cached_database_stats.cache_clear()
 
 if __name__ == '__main__':
     app.run(debug=False, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))